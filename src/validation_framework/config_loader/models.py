@@ -1,27 +1,72 @@
 """Structured models and loading helpers for YAML configuration files."""
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
+try:  # libyaml-backed loader, several times faster than the pure Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-class PayloadDefinition(BaseModel):
+_T = TypeVar("_T")
+
+
+class _FrozenModel(BaseModel):
+    """Base for configuration models, which are read-only once loaded."""
+
+    class Config:
+        # Nested models are immutable, so parents can reference them as-is
+        # instead of copying every child during validation.
+        copy_on_model_validation = "none"
+        allow_mutation = False
+
+
+class PayloadDefinition(_FrozenModel):
     """Definition of payload encoding details for a signal."""
 
     type: str = Field(..., description="The payload type, e.g. enum or numeric.")
     mapping: Dict[str, int] = Field(default_factory=dict)
 
+    _encode_table: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _decode_table: Dict[int, str] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._encode_table = {key.upper(): value for key, value in self.mapping.items()}
+        decode_table: Dict[int, str] = {}
+        for key, value in self.mapping.items():
+            decode_table.setdefault(value, key)
+        self._decode_table = decode_table
+
     @validator("type")
     def validate_type(cls, value: str) -> str:
         if value not in {"enum", "uint", "int"}:
             raise ValueError(f"Unsupported payload type: {value!r}")
         return value
 
+    @property
+    def encode_table(self) -> Dict[str, int]:
+        """Enum labels, upper-cased, mapped to their raw payload value."""
+
+        return self._encode_table
+
+    @property
+    def decode_table(self) -> Dict[int, str]:
+        """Raw payload values mapped back to the first label declaring them."""
 
-class SignalDefinition(BaseModel):
+        return self._decode_table
+
+
+class SignalDefinition(_FrozenModel):
     """Configuration describing a CAN signal."""
 
     name: str
@@ -36,18 +81,29 @@ class SignalDefinition(BaseModel):
         return int(value)
 
 
-class SignalCatalog(BaseModel):
+class SignalCatalog(_FrozenModel):
     """Container for all configured signals."""
 
     signals: Dict[str, SignalDefinition]
 
     @classmethod
     def from_path(cls, path: Path) -> "SignalCatalog":
-        data = yaml.safe_load(path.read_text())
+        return _load_cached(path, cls._parse)
+
+    @classmethod
+    def _parse(cls, path: Path) -> "SignalCatalog":
+        data = _load_yaml(path)
         definitions: Dict[str, SignalDefinition] = {}
         for name, payload in data.get("signals", {}).items():
+            # Names are looked up on every broker call and buses on every port
+            # lookup; interning lets dict probes succeed on identity.
+            name = sys.intern(name)
+            if isinstance(payload.get("bus"), str):
+                payload["bus"] = sys.intern(payload["bus"])
             definitions[name] = SignalDefinition(name=name, **payload)
-        return cls(signals=definitions)
+        # Every definition above has been validated already; re-running the
+        # validators over the whole mapping would only repeat that work.
+        return cls.construct(signals=definitions)
 
     def get(self, name: str) -> SignalDefinition:
         try:
@@ -56,26 +112,29 @@ class SignalCatalog(BaseModel):
             raise KeyError(f"Signal {name!r} is not defined in the configuration") from exc
 
 
-class PreconditionStep(BaseModel):
+class PreconditionStep(_FrozenModel):
     """A single declarative step within a precondition."""
 
     action: str
     target: str
     value: Optional[str] = None
+    # Contiguous steps sharing a group may run concurrently (see
+    # PreconditionService); ungrouped steps always run in order.
+    group: Optional[str] = None
 
 
-class PreconditionPolicy(BaseModel):
+class PreconditionPolicy(_FrozenModel):
     """Time and safety policies applied to a precondition."""
 
     timeout: float = 30.0
     polling_interval: float = 1.0
 
 
-class SafetyPolicy(BaseModel):
+class SafetyPolicy(_FrozenModel):
     abort_on_fault: bool = True
 
 
-class PreconditionDefinition(BaseModel):
+class PreconditionDefinition(_FrozenModel):
     """Complete description of a precondition."""
 
     name: str
@@ -86,16 +145,21 @@ class PreconditionDefinition(BaseModel):
     rollback: List[PreconditionStep] = Field(default_factory=list)
 
 
-class PreconditionCatalog(BaseModel):
+class PreconditionCatalog(_FrozenModel):
     preconditions: Dict[str, PreconditionDefinition]
 
     @classmethod
     def from_path(cls, path: Path) -> "PreconditionCatalog":
-        data = yaml.safe_load(path.read_text())
+        return _load_cached(path, cls._parse)
+
+    @classmethod
+    def _parse(cls, path: Path) -> "PreconditionCatalog":
+        data = _load_yaml(path)
         definitions: Dict[str, PreconditionDefinition] = {}
         for name, payload in data.get("preconditions", {}).items():
+            name = sys.intern(name)
             definitions[name] = PreconditionDefinition(name=name, **payload)
-        return cls(preconditions=definitions)
+        return cls.construct(preconditions=definitions)
 
     def get(self, name: str) -> PreconditionDefinition:
         try:
@@ -106,7 +170,7 @@ class PreconditionCatalog(BaseModel):
             ) from exc
 
 
-class FrameworkConfig(BaseModel):
+class FrameworkConfig(_FrozenModel):
     mode: str
     timeouts: Dict[str, float] = Field(default_factory=dict)
     logging: Dict[str, Optional[str]] = Field(default_factory=dict)
@@ -114,24 +178,89 @@ class FrameworkConfig(BaseModel):
 
     @classmethod
     def merge(cls, base_path: Path, profile_paths: Iterable[Path]) -> "FrameworkConfig":
-        base_data = yaml.safe_load(base_path.read_text())
-        merged = dict(base_data)
+        # Freshly parsed YAML is not shared with anyone, so it is merged in place.
+        merged = _load_yaml(base_path)
         for profile_path in profile_paths:
             if not profile_path.exists():
                 continue
-            profile = yaml.safe_load(profile_path.read_text())
-            merged = _deep_merge(merged, profile)
+            profile = _load_yaml(profile_path)
+            _deep_merge(merged, profile)
         return cls(**merged)
 
 
+def _load_yaml(path: Path) -> Dict:
+    # Hand the parser raw bytes; it detects the encoding itself, so decoding the
+    # file up front with ``read_text`` only adds a redundant copy.
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
+
+def _load_cached(path: Path, loader: Callable[[Path], _T]) -> _T:
+    """Return ``loader(path)``, reusing a pickled result from a previous run.
+
+    Cache entries live under ``$XDG_CACHE_HOME/validation_framework`` and are
+    keyed by the source file's path, modification time and size, the loader
+    and this module's own modification time, so editing either the YAML or
+    the models invalidates them.  Any cache failure falls back to parsing.
+    """
+
+    source = path.resolve()
+    stat = source.stat()
+    loader_name = getattr(loader, "__qualname__", repr(loader))
+    key = (
+        str(source),
+        stat.st_mtime_ns,
+        stat.st_size,
+        loader_name,
+        Path(__file__).stat().st_mtime_ns,
+    )
+    digest = hashlib.sha1(f"{source}:{loader_name}".encode()).hexdigest()
+    try:
+        cache_file = _cache_dir() / f"{digest}.cache"
+    except Exception:  # no usable cache location, e.g. no home directory
+        return loader(path)
+
+    try:
+        cached_key, value = pickle.loads(cache_file.read_bytes())
+        if cached_key == key:
+            return value
+    except Exception:  # missing, stale or unreadable cache entry
+        pass
+
+    value = loader(path)
+    temp_name: Optional[str] = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, delete=False) as handle:
+            temp_name = handle.name
+            pickle.dump((key, value), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, cache_file)
+        temp_name = None
+    except Exception:  # unwritable cache or unpicklable value; keep the parse
+        pass
+    finally:
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+    return value
+
+
+def _cache_dir() -> Path:
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "validation_framework"
+
+
 def _deep_merge(base: Dict, override: Dict) -> Dict:
-    result = dict(base)
+    """Merge ``override`` into ``base`` in place and return ``base``."""
+
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_merge(current, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
+    return base
 
 
 __all__ = [
@@ -2,39 +2,52 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict
+import threading
+import types
+from typing import Any, Dict, Mapping
 
 from ..exceptions import CanError
 from ..ports.base_can_port import BaseCanPort
 from .hil_can_port import HilCanPort
 from .mock_can_port import MockCanPort
 
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
 
 class HalManager:
     """Provide access to CAN ports across execution modes."""
 
     def __init__(self, mode: str, config: Dict[str, Dict], logger: logging.Logger):
         self._mode = mode.upper()
-        self._config = config
+        self._can_configs: Mapping[str, Mapping[str, Any]] = (
+            config.get("interfaces", {}).get("can") or _EMPTY
+        )
         self._logger = logger
         self._can_ports: Dict[str, BaseCanPort] = {}
+        self._lock = threading.Lock()
 
     def get_can_port(self, bus_name: str) -> BaseCanPort:
-        if bus_name in self._can_ports:
-            return self._can_ports[bus_name]
+        port = self._can_ports.get(bus_name)
+        if port is not None:
+            return port
+        # Precondition groups may resolve ports from worker threads; make sure
+        # only one port is ever opened per bus.
+        with self._lock:
+            port = self._can_ports.get(bus_name)
+            if port is None:
+                port = self._create_can_port(bus_name)
+                self._can_ports[bus_name] = port
+        return port
 
-        port_config = self._config.get("interfaces", {}).get("can", {}).get(bus_name, {})
+    def _create_can_port(self, bus_name: str) -> BaseCanPort:
+        port_config = self._can_configs.get(bus_name) or _EMPTY
         self._logger.debug("Creating CAN port for %s in %s mode", bus_name, self._mode)
 
         if self._mode == "HIL":
-            port = HilCanPort(bus_name, self._logger, **port_config)
-        elif self._mode in {"MOCK", "SIL"}:
-            port = MockCanPort(bus_name, self._logger)
-        else:
-            raise CanError(f"Unsupported execution mode: {self._mode}")
-
-        self._can_ports[bus_name] = port
-        return port
+            return HilCanPort(bus_name, self._logger, **port_config)
+        if self._mode in {"MOCK", "SIL"}:
+            return MockCanPort(bus_name, self._logger)
+        raise CanError(f"Unsupported execution mode: {self._mode}")
 
 
 __all__ = ["HalManager"]
@@ -1,25 +1,28 @@
 """Hardware backed CAN port intended for use on HIL benches."""
 from __future__ import annotations
 
+import contextlib
 import logging
-from typing import Any, Dict
+from types import ModuleType
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterator, List, Optional
 
 from ..exceptions import CanError, CanTimeoutError
 from ..ports.base_can_port import BaseCanPort
 from ..types.can_types import CanMessage, TransmissionResult
 
+_can: Optional[ModuleType] = None
+
+# Compare every identifier bit and leave the EFF flag out of the mask, so a
+# filter matches the id whether it arrives as a standard or extended frame.
+_CAN_ID_MASK = 0x1FFFFFFF
+
 
 class HilCanPort(BaseCanPort):
     """Adapter around python-can providing the HAL contract."""
 
     def __init__(self, bus_name: str, logger: logging.Logger, **can_config: Dict[str, Any]):
         super().__init__(bus_name, logger)
-        try:
-            import can  # type: ignore
-        except ImportError as exc:  # pragma: no cover - executed only without dependency
-            raise CanError(
-                "python-can must be installed to use HilCanPort"
-            ) from exc
+        can = _load_python_can()
 
         try:
             self._bus = can.interface.Bus(channel=can_config.get("channel", bus_name), **can_config)
@@ -27,6 +30,10 @@ class HilCanPort(BaseCanPort):
             raise CanError(f"Failed to initialise CAN bus {bus_name}: {exc}") from exc
 
         self._can = can
+        # Filters configured for the bench (``can_filters``); restored
+        # whenever no wait filter is installed.
+        self._configured_filters = self._bus.filters
+        self._active_filter: Optional[FrozenSet[int]] = None
 
     def send(self, message: CanMessage) -> TransmissionResult:
         payload = self._can.Message(
@@ -37,15 +44,71 @@ class HilCanPort(BaseCanPort):
         try:
             self._bus.send(payload)
             self.logger.debug("[%s] HIL SEND %s", self.bus_name, message)
-            return TransmissionResult(success=True)
+            return TransmissionResult.now(True)
         except self._can.CanError as exc:  # pragma: no cover - hardware failure path
             self.logger.error("[%s] HIL SEND failed: %s", self.bus_name, exc)
-            return TransmissionResult(success=False, error_message=str(exc))
+            return TransmissionResult.now(False, str(exc))
+
+    def receive(self, timeout_s: Optional[float] = 1.0) -> CanMessage:
+        return self._recv(timeout_s)
+
+    def receive_matching(
+        self, can_ids: AbstractSet[int], timeout_s: Optional[float] = 1.0
+    ) -> CanMessage:
+        """Receive the next frame in ``can_ids`` using the bus's own filtering.
+
+        python-can pushes the filter into the driver where supported (e.g.
+        ``CAN_RAW_FILTER`` on SocketCAN), so unrelated frames never reach
+        Python while the call waits.  Inside :meth:`filtered` covering
+        ``can_ids`` the installed filter is reused as is.
+        """
+
+        with self.filtered(can_ids):
+            return super().receive_matching(can_ids, timeout_s)
+
+    def receive_batch(
+        self, can_ids: AbstractSet[int], timeout_s: Optional[float] = 1.0, max_frames: int = 32
+    ) -> List[CanMessage]:
+        with self.filtered(can_ids):
+            return super().receive_batch(can_ids, timeout_s, max_frames)
+
+    @contextlib.contextmanager
+    def filtered(self, can_ids: AbstractSet[int]) -> Iterator[None]:
+        """Install ``can_ids`` as the bus filter for the duration of the block.
 
-    def receive(self, timeout_s: float = 1.0) -> CanMessage:
+        The filter must not outlive the wait: the kernel drops frames outside
+        it, so a leftover filter would silently discard frames that arrive
+        afterwards (e.g. the echo of a frame sent right after a wait).  Inside
+        a block already covering ``can_ids`` this is a no-op; otherwise the
+        previous filter is put back on exit.
+        """
+
+        can_ids = frozenset(can_ids)
+        previous = self._active_filter
+        if previous is not None and can_ids <= previous:
+            yield
+            return
+        self._apply_filter(can_ids)
+        try:
+            yield
+        finally:
+            self._apply_filter(previous)
+
+    def _apply_filter(self, can_ids: Optional[FrozenSet[int]]) -> None:
+        if can_ids == self._active_filter:
+            return
+        filters = self._configured_filters
+        if can_ids is not None:
+            filters = [{"can_id": can_id, "can_mask": _CAN_ID_MASK} for can_id in sorted(can_ids)]
+        self._bus.set_filters(filters)
+        self._active_filter = can_ids
+
+    def _recv(self, timeout_s: Optional[float]) -> CanMessage:
         payload = self._bus.recv(timeout=timeout_s)
         if payload is None:
             raise CanTimeoutError(f"Timeout on bus {self.bus_name} after {timeout_s}s")
+        # python-can hands out a mutable bytearray; CanMessage is frozen and
+        # hashable, so take one immutable copy (a single memcpy) here.
         return CanMessage(
             can_id=payload.arbitration_id,
             data=bytes(payload.data),
@@ -54,4 +117,23 @@ class HilCanPort(BaseCanPort):
         )
 
 
+def _load_python_can() -> ModuleType:
+    """Import python-can on first use and keep it for subsequent ports.
+
+    The import is deferred so MOCK and SIL runs, which never create a
+    :class:`HilCanPort`, do not pay for loading python-can.
+    """
+
+    global _can
+    if _can is None:
+        try:
+            import can  # type: ignore
+        except ImportError as exc:  # pragma: no cover - executed only without dependency
+            raise CanError(
+                "python-can must be installed to use HilCanPort"
+            ) from exc
+        _can = can
+    return _can
+
+
 __all__ = ["HilCanPort"]
@@ -1,10 +1,9 @@
 """In-memory CAN port suitable for MOCK and SIL execution modes."""
 from __future__ import annotations
 
-import collections
 import logging
-import time
-from typing import Deque
+import queue
+from typing import Optional
 
 from ..exceptions import CanTimeoutError
 from ..ports.base_can_port import BaseCanPort
@@ -16,29 +15,32 @@ class MockCanPort(BaseCanPort):
 
     def __init__(self, bus_name: str, logger: logging.Logger):
         super().__init__(bus_name, logger)
-        self._rx_queue: Deque[CanMessage] = collections.deque()
+        self._rx_queue: queue.Queue[CanMessage] = queue.Queue()
 
     def inject_message(self, message: CanMessage) -> None:
         """Inject a message as if it was received from the bus."""
 
-        self._rx_queue.append(message.with_timestamp())
+        self._rx_queue.put(message.with_timestamp())
 
     def send(self, message: CanMessage) -> TransmissionResult:
         self.logger.debug("[%s] MOCK SEND %s", self.bus_name, message)
         # In mock mode we simply acknowledge the message.
-        return TransmissionResult(success=True, timestamp=time.time())
+        return TransmissionResult.now(True)
 
-    def receive(self, timeout_s: float = 1.0) -> CanMessage:
-        if not self._rx_queue:
+    def receive(self, timeout_s: Optional[float] = 1.0) -> CanMessage:
+        if self._rx_queue.empty():
             self.logger.debug("[%s] MOCK RECEIVE waiting for message", self.bus_name)
-        start = time.time()
-        while time.time() - start < timeout_s:
-            if self._rx_queue:
-                message = self._rx_queue.popleft()
-                self.logger.debug("[%s] MOCK RECEIVE %s", self.bus_name, message)
-                return message
-            time.sleep(0.01)
-        raise CanTimeoutError(f"Timeout on bus {self.bus_name} after {timeout_s}s")
+        try:
+            # Blocks until inject_message() wakes us up, not on a sleep loop.
+            message = self._rx_queue.get(
+                timeout=None if timeout_s is None else max(timeout_s, 0.0)
+            )
+        except queue.Empty:
+            raise CanTimeoutError(
+                f"Timeout on bus {self.bus_name} after {timeout_s}s"
+            ) from None
+        self.logger.debug("[%s] MOCK RECEIVE %s", self.bus_name, message)
+        return message
 
 
 __all__ = ["MockCanPort"]
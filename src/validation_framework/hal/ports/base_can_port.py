@@ -1,8 +1,11 @@
 """Abstract contract for CAN ports."""
 from __future__ import annotations
 
+import contextlib
 import logging
+import time
 from abc import ABC, abstractmethod
+from typing import AbstractSet, Iterator, List, Optional, Sequence
 
 from ..exceptions import CanTimeoutError
 from ..types.can_types import CanMessage, TransmissionResult
@@ -19,13 +22,94 @@ class BaseCanPort(ABC):
     def send(self, message: CanMessage) -> TransmissionResult:
         """Send a message on the bus."""
 
+    def send_batch(self, messages: Sequence[CanMessage]) -> List[TransmissionResult]:
+        """Send ``messages`` back-to-back, in order.
+
+        Stops at the first unsuccessful transmission; the returned list holds
+        one result per message attempted.  Ports able to burst frames in one
+        driver call may override this.
+        """
+
+        results: List[TransmissionResult] = []
+        for message in messages:
+            result = self.send(message)
+            results.append(result)
+            if not result.success:
+                break
+        return results
+
     @abstractmethod
-    def receive(self, timeout_s: float = 1.0) -> CanMessage:
+    def receive(self, timeout_s: Optional[float] = 1.0) -> CanMessage:
         """Receive the next message from the bus.
 
         Implementations MUST raise :class:`CanTimeoutError` when no message is
-        available before ``timeout_s`` expires.
+        available before ``timeout_s`` expires, and block until a message
+        arrives when ``timeout_s`` is ``None``.
+        """
+
+    @contextlib.contextmanager
+    def filtered(self, can_ids: AbstractSet[int]) -> Iterator[None]:
+        """Narrow reception to ``can_ids`` for the duration of the block.
+
+        Callers hold this around a whole wait made of several receive calls.
+        Nothing may be sent from inside the block, as the echo could be
+        filtered away.  The default does nothing; ports that can filter in
+        the driver or kernel override it.
+        """
+
+        yield
+
+    def receive_matching(
+        self, can_ids: AbstractSet[int], timeout_s: Optional[float] = 1.0
+    ) -> CanMessage:
+        """Receive the next message whose identifier is in ``can_ids``.
+
+        Frames with other identifiers are consumed and dropped.  The default
+        implementation filters in Python; ports backed by hardware should
+        override it to filter in the driver or kernel instead.  Raises
+        :class:`CanTimeoutError` when no matching frame arrives in time;
+        ``timeout_s=None`` waits indefinitely.
+        """
+
+        clock = time.monotonic
+        deadline = None if timeout_s is None else clock() + timeout_s
+        remaining = timeout_s
+        # Checked once per call: on a busy bus the drop log below would
+        # otherwise cost a method call and an argument tuple per frame.
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        while True:
+            message = self.receive(timeout_s=remaining)
+            if message.can_id in can_ids:
+                return message
+            if debug:
+                self.logger.debug("[%s] Dropping CAN id %s", self.bus_name, message.can_id)
+            if deadline is None:
+                continue
+            remaining = deadline - clock()
+            if remaining <= 0.0:
+                raise CanTimeoutError(
+                    f"Timeout on bus {self.bus_name} after {timeout_s}s"
+                )
+
+    def receive_batch(
+        self, can_ids: AbstractSet[int], timeout_s: Optional[float] = 1.0, max_frames: int = 32
+    ) -> List[CanMessage]:
+        """Receive up to ``max_frames`` frames whose identifier is in ``can_ids``.
+
+        Blocks for at most ``timeout_s`` for the first frame, then collects
+        whatever is already queued without waiting again.  Raises
+        :class:`CanTimeoutError` when not even one matching frame arrives.
+        Ports with a vectored receive (e.g. ``recvmmsg``) may override this to
+        fetch the whole batch in one call.
         """
 
+        batch = [self.receive_matching(can_ids, timeout_s=timeout_s)]
+        while len(batch) < max_frames:
+            try:
+                batch.append(self.receive_matching(can_ids, timeout_s=0.0))
+            except CanTimeoutError:
+                break
+        return batch
+
 
 __all__ = ["BaseCanPort"]
@@ -6,9 +6,9 @@ from dataclasses import dataclass
 from typing import NamedTuple, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CanMessage:
-    """Representation of a CAN frame."""
+    """Immutable representation of a CAN frame."""
 
     can_id: int
     data: bytes
@@ -16,13 +16,15 @@ class CanMessage:
     timestamp: Optional[float] = None
 
     def with_timestamp(self) -> "CanMessage":
-        """Return a copy of the message with a capture timestamp."""
+        """Return the message with a capture timestamp, stamping it if missing."""
 
+        if self.timestamp is not None:
+            return self
         return CanMessage(
             can_id=self.can_id,
             data=self.data,
             is_extended_id=self.is_extended_id,
-            timestamp=time.time() if self.timestamp is None else self.timestamp,
+            timestamp=time.time(),
         )
 
 
@@ -31,7 +33,13 @@ class TransmissionResult(NamedTuple):
 
     success: bool
     error_message: Optional[str] = None
-    timestamp: float = time.time()
+    timestamp: Optional[float] = None
+
+    @classmethod
+    def now(cls, success: bool, error_message: Optional[str] = None) -> "TransmissionResult":
+        """Build a result stamped with the current time."""
+
+        return cls(success, error_message, time.time())
 
 
 __all__ = ["CanMessage", "TransmissionResult"]
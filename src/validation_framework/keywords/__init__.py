@@ -1,9 +1,10 @@
 """Robot Framework entry point wiring together the validation stack."""
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from robot.libraries.BuiltIn import BuiltIn
 
@@ -63,27 +64,30 @@ class ValidationFramework:
         for library in self._libraries:
             for name, func in self._extract_keywords(library).items():
                 self._keywords[name] = func
+        # Robot usually passes the exact published name; keep it alongside the
+        # upper-cased form so only case variants pay for ``str.upper``.
         self._keyword_lookup = {name.upper(): func for name, func in self._keywords.items()}
+        self._keyword_lookup.update(self._keywords)
 
     def get_keyword_names(self):  # pragma: no cover - Robot Framework hook
         return list(self._keywords.keys())
 
     def run_keyword(self, name, args, kwargs=None):  # pragma: no cover - Robot hook
         kwargs = kwargs or {}
-        try:
-            func = self._keyword_lookup[name.upper()]
-        except KeyError as exc:
-            raise AttributeError(f"Unknown keyword: {name}") from exc
+        lookup = self._keyword_lookup
+        func = lookup.get(name)
+        if func is None:
+            try:
+                func = lookup[name.upper()]
+            except KeyError as exc:
+                raise AttributeError(f"Unknown keyword: {name}") from exc
         return func(*args, **kwargs)
 
     def _extract_keywords(self, library):
-        mapping: Dict[str, Callable[..., object]] = {}
-        for attribute_name in dir(library):
-            attribute = getattr(library, attribute_name)
-            if callable(attribute):
-                robot_name = getattr(attribute, "robot_name", None)
-                if robot_name:
-                    mapping[robot_name] = attribute
+        mapping: Dict[str, Callable[..., object]] = {
+            robot_name: getattr(library, attribute_name)
+            for robot_name, attribute_name in _keyword_attributes(type(library))
+        }
         if hasattr(library, "get_keyword_names"):
             for name in library.get_keyword_names():
                 if name not in mapping:
@@ -93,6 +97,20 @@ class ValidationFramework:
         return mapping
 
 
+@functools.lru_cache(maxsize=None)
+def _keyword_attributes(library_type: type) -> Tuple[Tuple[str, str], ...]:
+    """Return ``(robot_name, attribute_name)`` pairs declared on ``library_type``."""
+
+    pairs = []
+    for attribute_name in dir(library_type):
+        attribute = getattr(library_type, attribute_name)
+        if callable(attribute):
+            robot_name = getattr(attribute, "robot_name", None)
+            if robot_name:
+                pairs.append((robot_name, attribute_name))
+    return tuple(pairs)
+
+
 def _create_logger(name: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger(name or "validation_framework")
     if not logger.handlers:
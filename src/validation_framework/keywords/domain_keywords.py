@@ -1,17 +1,127 @@
 """Robot Framework keywords that expose complex domain flows."""
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence
+import functools
+from collections.abc import Callable
 
 from robot.api.deco import keyword
 
 from ..services.domain_service import DomainService
 
+_TRUTHY = frozenset({"TRUE", "1", "YES", "ON", "ENABLED"})
+
+
+def _is_truthy(value: str) -> bool:
+    """Interpret a Robot argument such as ``True``/``yes``/``on`` as a boolean."""
+
+    return value.strip().upper() in _TRUTHY
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_signals(signals: tuple[str, ...]) -> tuple[str, ...]:
+    """Split and strip a signal list given as varargs or one comma-separated string.
+
+    Memoised: data-driven suites pass the same lists over and over.
+    """
+
+    if not signals:
+        return ()
+    if len(signals) == 1:
+        token = signals[0]
+        if "," not in token:
+            token = token.strip()
+            return (token,) if token else ()
+        signals = tuple(token.split(","))
+    return tuple(name for name in (signal.strip() for signal in signals) if name)
+
+
+def _precondition_keyword(robot_name: str, precondition: str) -> Callable[..., None]:
+    """Build a ``PRECOND.Ensure ...`` keyword applying catalog entry ``precondition``."""
+
+    @keyword(robot_name)
+    def ensure(self: DomainKeywords) -> None:
+        self._domain.ensure_precondition(precondition)
+
+    return ensure
+
+
+_DOMAIN_KEYWORDS: tuple[str, ...] = (
+    "PRECOND.Ensure Standby",
+    "PRECOND.Ensure In Use",
+    "PRECOND.Ensure Driving",
+    "PRECOND.Ensure Charging",
+    "PRECOND.Ensure HVAC Base",
+    "PRECOND.Ensure Lighting Base",
+    "BUS.Get Signal",
+    "BACKEND.Send Command",
+    "BACKEND.Wait For Ack",
+    "BACKEND.Assert Vehicle Consistency",
+    "CAPTURE.Start",
+    "CAPTURE.Stop",
+    "EVIDENCE.Snapshot",
+    "DIAG.Read DTC",
+    "DIAG.Clear DTC",
+    "DIAG.Verify No Active DTC",
+    "VERIFY.No Active DTCs ECU",
+    "VERIFY.No Communication Faults",
+    "RTCU.Trigger ECall",
+    "RTCU.Cancel ECall",
+    "BACKEND.Send Remote Lock",
+    "BACKEND.Wait Ack",
+    "VERIFY.Emergency LED ==",
+    "VERIFY.PSAP Session Established ==",
+    "SOMEIP.Wait Field",
+    "VERIFY.Cluster Telltale ==",
+    "BRAIN.Set Securement State =",
+    "VERIFY.Securement State ==",
+    "WIRED.Set",
+    "VERIFY.WIRED Output ==",
+    "BUS.Verify Signal ==",
+    "ZONAL.FRONT.Set Door =",
+    "ZONAL.FRONT.Set Low Beam =",
+    "VERIFY.Low Beam State ==",
+    "VERIFY.Door State ==",
+    "ZONAL.CABIN.Set Seatbelt =",
+    "ZONAL.CABIN.Command Window =",
+    "HVAC.Set Temperature =",
+    "VERIFY.HVAC Mode ==",
+    "HVAC.Enable Demist",
+    "VERIFY.Defrost ==",
+    "ADAS.Enable",
+    "ADAS.Disable",
+    "ADAS.Set Vehicle Speed =",
+    "ADAS.Inject Obstacle distance=",
+    "VERIFY.WPP.ControlRequest ==",
+    "ENERGY.Connect EVSE",
+    "ENERGY.Disconnect EVSE",
+    "VERIFY.Charging Active ==",
+    "VEHICLE.Press Brake",
+    "VEHICLE.Release Brake",
+    "VERIFY.Cluster Brake Telltale ==",
+    "VERIFY.Vehicle Securement State ==",
+    "LIGHTS.Set High Beam =",
+    "LIGHTS.Flash To Pass",
+    "VERIFY.Light Availability ==",
+    "WIPERS.Set Mode =",
+    "WIPERS.Spray",
+    "VERIFY.Wipers State ==",
+    "ACCESS.Lock Vehicle",
+    "ACCESS.Unlock Vehicle",
+    "VERIFY.Door ==",
+    "ACCESS.Open Luggage",
+    "VERIFY.Luggage State ==",
+    "PACE.Enable Limiter",
+    "PACE.Set Limit =",
+    "VERIFY.Speed Limit Status ==",
+    "ECU.Ping",
+)
+
 
 class DomainKeywords:
     """Expose orchestration heavy keywords backed by :class:`DomainService`."""
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    __slots__ = ("_domain",)
 
     def __init__(self, domain: DomainService):
         self._domain = domain
@@ -19,29 +129,12 @@ class DomainKeywords:
     # ------------------------------------------------------------------
     # Global macros and helpers
     # ------------------------------------------------------------------
-    @keyword("PRECOND.Ensure Standby")
-    def ensure_standby(self) -> None:
-        self._domain.ensure_precondition("Standby")
-
-    @keyword("PRECOND.Ensure In Use")
-    def ensure_in_use(self) -> None:
-        self._domain.ensure_precondition("InUse")
-
-    @keyword("PRECOND.Ensure Driving")
-    def ensure_driving(self) -> None:
-        self._domain.ensure_precondition("Driving")
-
-    @keyword("PRECOND.Ensure Charging")
-    def ensure_charging(self) -> None:
-        self._domain.ensure_precondition("Charging")
-
-    @keyword("PRECOND.Ensure HVAC Base")
-    def ensure_hvac_base(self) -> None:
-        self._domain.ensure_precondition("HVACBase")
-
-    @keyword("PRECOND.Ensure Lighting Base")
-    def ensure_lighting_base(self) -> None:
-        self._domain.ensure_precondition("LightingBase")
+    ensure_standby = _precondition_keyword("PRECOND.Ensure Standby", "Standby")
+    ensure_in_use = _precondition_keyword("PRECOND.Ensure In Use", "InUse")
+    ensure_driving = _precondition_keyword("PRECOND.Ensure Driving", "Driving")
+    ensure_charging = _precondition_keyword("PRECOND.Ensure Charging", "Charging")
+    ensure_hvac_base = _precondition_keyword("PRECOND.Ensure HVAC Base", "HVACBase")
+    ensure_lighting_base = _precondition_keyword("PRECOND.Ensure Lighting Base", "LightingBase")
 
     @keyword("BUS.Get Signal")
     def bus_get_signal(self, signal: str, timeout: float = 1.0):
@@ -57,7 +150,7 @@ class DomainKeywords:
 
     @keyword("BACKEND.Assert Vehicle Consistency")
     def backend_assert_vehicle_consistency(self, *signals: str) -> None:
-        resolved = self._normalize_signals(signals)
+        resolved = _normalize_signals(signals)
         self._domain.assert_backend_consistency(resolved)
 
     @keyword("CAPTURE.Start")
@@ -73,7 +166,7 @@ class DomainKeywords:
         self._domain.snapshot_state(label)
 
     @keyword("DIAG.Read DTC")
-    def diag_read_dtc(self, ecu: str) -> List[str]:
+    def diag_read_dtc(self, ecu: str) -> list[str]:
         return self._domain.read_dtc(ecu)
 
     @keyword("DIAG.Clear DTC")
@@ -119,7 +212,7 @@ class DomainKeywords:
 
     @keyword("VERIFY.PSAP Session Established ==")
     def verify_psap_session(self, state: str) -> None:
-        self._domain.verify_psap_session(state.strip().upper() in {"TRUE", "1", "YES"})
+        self._domain.verify_psap_session(_is_truthy(state))
 
     # ------------------------------------------------------------------
     # SOME-IP / cluster
@@ -234,7 +327,7 @@ class DomainKeywords:
 
     @keyword("VERIFY.Charging Active ==")
     def verify_charging_active(self, expected: str) -> None:
-        self._domain.verify_charging_active(expected.strip().upper() in {"TRUE", "1", "YES"})
+        self._domain.verify_charging_active(_is_truthy(expected))
 
     # ------------------------------------------------------------------
     # Brake / securement
@@ -330,84 +423,8 @@ class DomainKeywords:
     def ecu_ping(self, ecu: str) -> None:
         self._domain.ecu_ping(ecu)
 
-    def get_keyword_names(self) -> List[str]:  # pragma: no cover - Robot hook
-        return [
-            "PRECOND.Ensure Standby",
-            "PRECOND.Ensure In Use",
-            "PRECOND.Ensure Driving",
-            "PRECOND.Ensure Charging",
-            "PRECOND.Ensure HVAC Base",
-            "PRECOND.Ensure Lighting Base",
-            "BUS.Get Signal",
-            "BACKEND.Send Command",
-            "BACKEND.Wait For Ack",
-            "BACKEND.Assert Vehicle Consistency",
-            "CAPTURE.Start",
-            "CAPTURE.Stop",
-            "EVIDENCE.Snapshot",
-            "DIAG.Read DTC",
-            "DIAG.Clear DTC",
-            "DIAG.Verify No Active DTC",
-            "VERIFY.No Active DTCs ECU",
-            "VERIFY.No Communication Faults",
-            "RTCU.Trigger ECall",
-            "RTCU.Cancel ECall",
-            "BACKEND.Send Remote Lock",
-            "BACKEND.Wait Ack",
-            "VERIFY.Emergency LED ==",
-            "VERIFY.PSAP Session Established ==",
-            "SOMEIP.Wait Field",
-            "VERIFY.Cluster Telltale ==",
-            "BRAIN.Set Securement State =",
-            "VERIFY.Securement State ==",
-            "WIRED.Set",
-            "VERIFY.WIRED Output ==",
-            "BUS.Verify Signal ==",
-            "ZONAL.FRONT.Set Door =",
-            "ZONAL.FRONT.Set Low Beam =",
-            "VERIFY.Low Beam State ==",
-            "VERIFY.Door State ==",
-            "ZONAL.CABIN.Set Seatbelt =",
-            "ZONAL.CABIN.Command Window =",
-            "HVAC.Set Temperature =",
-            "VERIFY.HVAC Mode ==",
-            "HVAC.Enable Demist",
-            "VERIFY.Defrost ==",
-            "ADAS.Enable",
-            "ADAS.Disable",
-            "ADAS.Set Vehicle Speed =",
-            "ADAS.Inject Obstacle distance=",
-            "VERIFY.WPP.ControlRequest ==",
-            "ENERGY.Connect EVSE",
-            "ENERGY.Disconnect EVSE",
-            "VERIFY.Charging Active ==",
-            "VEHICLE.Press Brake",
-            "VEHICLE.Release Brake",
-            "VERIFY.Cluster Brake Telltale ==",
-            "VERIFY.Vehicle Securement State ==",
-            "LIGHTS.Set High Beam =",
-            "LIGHTS.Flash To Pass",
-            "VERIFY.Light Availability ==",
-            "WIPERS.Set Mode =",
-            "WIPERS.Spray",
-            "VERIFY.Wipers State ==",
-            "ACCESS.Lock Vehicle",
-            "ACCESS.Unlock Vehicle",
-            "VERIFY.Door ==",
-            "ACCESS.Open Luggage",
-            "VERIFY.Luggage State ==",
-            "PACE.Enable Limiter",
-            "PACE.Set Limit =",
-            "VERIFY.Speed Limit Status ==",
-            "ECU.Ping",
-        ]
-
-    def _normalize_signals(self, signals: Sequence[str]) -> Iterable[str]:
-        if len(signals) == 1:
-            token = signals[0]
-            if "," in token:
-                return [part.strip() for part in token.split(",") if part.strip()]
-        return [signal.strip() for signal in signals if signal.strip()]
+    def get_keyword_names(self) -> tuple[str, ...]:  # pragma: no cover - Robot hook
+        return _DOMAIN_KEYWORDS
 
 
 __all__ = ["DomainKeywords"]
@@ -1,17 +1,27 @@
 """Robot Framework keywords exposing HMI functionality."""
 from __future__ import annotations
 
-from typing import List
-
 from robot.api.deco import keyword
 
 from ..services.hmi_service import HmiService
 
+_HMI_KEYWORDS: tuple[str, ...] = (
+    "HMI.Press",
+    "HMI.Navigate",
+    "HMI.Expect Telltale",
+    "HMI.Open App",
+    "HMI.Select",
+    "WIPERS.Activate Mode",
+    "BUS.Set Signal",
+    "BUS.Wait For Signal ==",
+)
+
 
 class HmiKeywords:
     """Keywords wrapping :class:`HmiService`."""
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    __slots__ = ("_service",)
 
     def __init__(self, service: HmiService):
         self._service = service
@@ -64,17 +74,8 @@ class HmiKeywords:
 
         self._service.wait_for_signal(signal, value, float(timeout))
 
-    def get_keyword_names(self) -> List[str]:  # pragma: no cover - Robot hook
-        return [
-            "HMI.Press",
-            "HMI.Navigate",
-            "HMI.Expect Telltale",
-            "HMI.Open App",
-            "HMI.Select",
-            "WIPERS.Activate Mode",
-            "BUS.Set Signal",
-            "BUS.Wait For Signal ==",
-        ]
+    def get_keyword_names(self) -> tuple[str, ...]:  # pragma: no cover - Robot hook
+        return _HMI_KEYWORDS
 
 
 __all__ = ["HmiKeywords"]
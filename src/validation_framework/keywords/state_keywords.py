@@ -1,17 +1,20 @@
 """Robot Framework keywords handling stateful operations such as preconditions."""
 from __future__ import annotations
 
-from typing import List
-
 from robot.api.deco import keyword
 
 from ..services.precondition_service import PreconditionService
 
+_STATE_KEYWORDS: tuple[str, ...] = (
+    "PRECOND.Apply",
+)
+
 
 class StateKeywords:
     """Expose precondition operations to Robot Framework."""
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    __slots__ = ("_service",)
 
     def __init__(self, service: PreconditionService):
         self._service = service
@@ -22,8 +25,8 @@ class StateKeywords:
 
         self._service.apply(name)
 
-    def get_keyword_names(self) -> List[str]:  # pragma: no cover - Robot hook
-        return ["PRECOND.Apply"]
+    def get_keyword_names(self) -> tuple[str, ...]:  # pragma: no cover - Robot hook
+        return _STATE_KEYWORDS
 
 
 __all__ = ["StateKeywords"]
@@ -1,16 +1,25 @@
 """Middleware orchestrating signal interactions across the HAL."""
 from __future__ import annotations
 
+import contextlib
 import logging
 import time
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from ..config_loader.models import SignalCatalog, SignalDefinition
 from ..hal.exceptions import CanTimeoutError, HalError
 from ..hal.implementations.hal_manager import HalManager
+from ..hal.ports.base_can_port import BaseCanPort
 from ..hal.types.can_types import CanMessage
 from .exceptions import EnvironmentFault, SutFault
 
+_Encoder = Callable[[Any], CanMessage]
+_Decoder = Callable[[CanMessage], Any]
+_Resolved = Tuple[SignalDefinition, BaseCanPort, _Encoder, _Decoder]
+
+# Every possible one-byte payload, so encoding never allocates a new bytes.
+_BYTE_CACHE: Tuple[bytes, ...] = tuple(i.to_bytes(1, byteorder="big") for i in range(256))
+
 
 class InteractionBroker:
     """Translate domain level interactions into HAL calls."""
@@ -19,11 +28,34 @@ class InteractionBroker:
         self._config = config
         self._hal = hal_manager
         self._logger = logger
+        self._resolved: Dict[str, _Resolved] = {}
 
     def set_signal(self, signal_name: str, value: Any) -> None:
-        signal_def = self._config.get(signal_name)
-        can_port = self._hal.get_can_port(signal_def.bus)
-        message = self._encode(signal_def, value)
+        self._send(signal_name, self._resolve(signal_name), value)
+
+    def set_and_confirm(
+        self,
+        signal_name: str,
+        value: Any,
+        timeout_s: Optional[float] = 5.0,
+        confirm_signal: Optional[str] = None,
+    ) -> None:
+        """Send ``value`` on ``signal_name`` and wait until it is reported back.
+
+        The echo is expected on ``confirm_signal`` when given (e.g. a status
+        signal answering a command), otherwise on ``signal_name`` itself,
+        which is then resolved only once for both halves.
+        """
+
+        resolved = self._resolve(signal_name)
+        self._send(signal_name, resolved, value)
+        if confirm_signal is not None and confirm_signal != signal_name:
+            signal_name, resolved = confirm_signal, self._resolve(confirm_signal)
+        self._wait(signal_name, resolved, value, timeout_s)
+
+    def _send(self, signal_name: str, resolved: _Resolved, value: Any) -> None:
+        signal_def, can_port, encode, _ = resolved
+        message = encode(value)
         try:
             result = can_port.send(message)
         except HalError as exc:
@@ -34,73 +66,123 @@ class InteractionBroker:
                 f"Transmission on bus {signal_def.bus} failed: {result.error_message}"
             )
 
+    def set_signals(self, assignments: Iterable[Tuple[str, Any]]) -> None:
+        """Send several ``(signal_name, value)`` assignments in order.
+
+        Every value is encoded before anything is transmitted, so an invalid
+        value aborts the whole group.  Consecutive assignments on the same
+        port are handed to :meth:`BaseCanPort.send_batch` together.
+        """
+
+        runs: List[Tuple[BaseCanPort, List[str], List[CanMessage]]] = []
+        for signal_name, value in assignments:
+            _, can_port, encode, _ = self._resolve(signal_name)
+            if not runs or runs[-1][0] is not can_port:
+                runs.append((can_port, [], []))
+            runs[-1][1].append(signal_name)
+            runs[-1][2].append(encode(value))
+
+        for can_port, names, messages in runs:
+            try:
+                results = can_port.send_batch(messages)
+            except HalError as exc:
+                raise EnvironmentFault(
+                    f"HAL failure while sending {', '.join(names)}: {exc}"
+                ) from exc
+            for result in results:
+                if not result.success:
+                    raise EnvironmentFault(
+                        f"Transmission on bus {can_port.bus_name} failed: {result.error_message}"
+                    )
+
     def wait_for_signal(
         self,
         signal_name: str,
         expected_value: Any,
         timeout_s: Optional[float] = None,
-        polling_interval: float = 0.1,
     ) -> None:
-        signal_def = self._config.get(signal_name)
-        can_port = self._hal.get_can_port(signal_def.bus)
-        deadline = None if timeout_s is None else time.time() + timeout_s
+        """Block until ``signal_name`` decodes to ``expected_value``.
 
-        while True:
-            if deadline and time.time() > deadline:
-                raise SutFault(
-                    f"System did not produce signal {signal_name}={expected_value} before timeout"
-                )
-            try:
-                message = can_port.receive(timeout_s=polling_interval)
-            except CanTimeoutError:
-                if deadline is None:
+        Without ``timeout_s`` the wait is unbounded.  Each receive blocks for
+        the whole remaining budget, so the call wakes only when a matching
+        frame arrives or the deadline passes.
+        """
+
+        self._wait(signal_name, self._resolve(signal_name), expected_value, timeout_s)
+
+    def _wait(
+        self,
+        signal_name: str,
+        resolved: _Resolved,
+        expected_value: Any,
+        timeout_s: Optional[float],
+    ) -> None:
+        signal_def, can_port, encode, decode = resolved
+        bus_name = signal_def.bus
+        expected_payload = _expected_payload(encode, decode, expected_value)
+        clock = time.monotonic
+        deadline = None if timeout_s is None else clock() + timeout_s
+        can_ids = {signal_def.can_id}
+        receive = can_port.receive_matching
+        remaining = None if timeout_s is None else max(timeout_s, 0.0)
+        with can_port.filtered(can_ids):
+            while True:
+                try:
+                    message = receive(can_ids, timeout_s=remaining)
+                except CanTimeoutError:
+                    if deadline is None:
+                        continue
+                    remaining = deadline - clock()
+                    if remaining <= 0.0:
+                        raise SutFault(
+                            f"Timeout waiting for {signal_name}={expected_value} on bus {bus_name}"
+                        )
                     continue
-                if time.time() > deadline:
-                    raise SutFault(
-                        f"Timeout waiting for {signal_name}={expected_value} on bus {signal_def.bus}"
-                    )
-                continue
-            except HalError as exc:
-                raise EnvironmentFault(f"HAL failure while waiting for {signal_name}: {exc}") from exc
+                except HalError as exc:
+                    raise EnvironmentFault(
+                        f"HAL failure while waiting for {signal_name}: {exc}"
+                    ) from exc
 
-            if message.can_id != signal_def.can_id:
-                self._logger.debug(
-                    "Ignoring CAN id %s while waiting for %s", message.can_id, signal_def.name
-                )
-                continue
+                if expected_payload is not None:
+                    data = message.data
+                    matched = (data[0] if data else 0) == expected_payload
+                else:
+                    matched = decode(message) == expected_value
+                if matched:
+                    self._logger.debug("%s satisfied with value %s", signal_name, expected_value)
+                    return
 
-            decoded = self._decode(signal_def, message)
-            if decoded == expected_value:
-                self._logger.debug("%s satisfied with value %s", signal_name, decoded)
-                return
+                if deadline is not None:
+                    remaining = deadline - clock()
+                    if remaining <= 0.0:
+                        raise SutFault(
+                            f"System did not produce signal {signal_name}={expected_value} "
+                            "before timeout"
+                        )
 
     def get_signal(self, signal_name: str, timeout_s: float = 1.0) -> Any:
         """Retrieve the latest value for ``signal_name`` within ``timeout_s`` seconds."""
 
-        signal_def = self._config.get(signal_name)
-        can_port = self._hal.get_can_port(signal_def.bus)
-        deadline = time.time() + timeout_s
+        signal_def, can_port, _, decode = self._resolve(signal_name)
+        clock = time.monotonic
+        deadline = clock() + timeout_s
+        can_ids = {signal_def.can_id}
 
-        while True:
-            remaining = max(deadline - time.time(), 0.0)
-            if remaining <= 0.0:
-                raise SutFault(f"Did not observe signal {signal_name} before timeout")
-            try:
-                message = can_port.receive(timeout_s=min(remaining, 0.1))
-            except CanTimeoutError:
-                continue
-            except HalError as exc:
-                raise EnvironmentFault(f"HAL failure while reading {signal_name}: {exc}") from exc
-
-            if message.can_id != signal_def.can_id:
-                self._logger.debug(
-                    "Ignoring CAN id %s while reading %s", message.can_id, signal_def.name
-                )
-                continue
+        with can_port.filtered(can_ids):
+            while True:
+                remaining = deadline - clock()
+                if remaining <= 0.0:
+                    raise SutFault(f"Did not observe signal {signal_name} before timeout")
+                try:
+                    message = can_port.receive_matching(can_ids, timeout_s=remaining)
+                except CanTimeoutError:
+                    continue
+                except HalError as exc:
+                    raise EnvironmentFault(f"HAL failure while reading {signal_name}: {exc}") from exc
 
-            value = self._decode(signal_def, message)
-            self._logger.debug("Read %s=%s", signal_name, value)
-            return value
+                value = decode(message)
+                self._logger.debug("Read %s=%s", signal_name, value)
+                return value
 
     def assert_signal_equal(self, signal_name: str, expected_value: Any, timeout_s: float = 1.0) -> None:
         """Assert that ``signal_name`` eventually equals ``expected_value``."""
@@ -116,9 +198,17 @@ class InteractionBroker:
     ) -> None:
         """Ensure that ``signal_name`` resolves to one of ``expected_values``."""
 
+        # Materialise once: generators would be exhausted by the membership
+        # test and leave nothing for the error message.
+        expected = tuple(expected_values)
         observed = self.get_signal(signal_name, timeout_s=timeout_s)
-        if observed not in expected_values:
-            formatted = ", ".join(repr(value) for value in expected_values)
+        try:
+            hit = observed in frozenset(expected)
+        except TypeError:
+            # Unhashable candidates or value: fall back to a linear scan.
+            hit = observed in expected
+        if not hit:
+            formatted = ", ".join(repr(value) for value in expected)
             raise SutFault(
                 f"Signal {signal_name} expected to be in {{{formatted}}} but was {observed!r}"
             )
@@ -141,11 +231,12 @@ class InteractionBroker:
     def assert_consistent_signals(
         self, signal_names: Iterable[str], timeout_s: float = 1.0
     ) -> None:
-        """Validate that all signals in ``signal_names`` converge to the same value."""
+        """Validate that all signals in ``signal_names`` converge to the same value.
 
-        observed_values = {
-            name: self.get_signal(name, timeout_s=timeout_s) for name in signal_names
-        }
+        All signals are read in a single pass sharing one ``timeout_s`` budget.
+        """
+
+        observed_values = self._get_signals_batch(signal_names, timeout_s)
         unique_values = set(observed_values.values())
         if len(unique_values) > 1:
             raise SutFault(
@@ -154,37 +245,173 @@ class InteractionBroker:
             )
 
     def assert_no_faults(self, fault_signal_names: Iterable[str], timeout_s: float = 1.0) -> None:
-        """Ensure that all provided fault indicator signals resolve to a healthy state."""
+        """Ensure that all provided fault indicator signals resolve to a healthy state.
+
+        All indicators are read in a single pass sharing one ``timeout_s`` budget.
+        """
 
-        for name in fault_signal_names:
-            observed = self.get_signal(name, timeout_s=timeout_s)
+        for name, observed in self._get_signals_batch(fault_signal_names, timeout_s).items():
             if observed not in (0, "NONE", "INACTIVE", "OK"):
                 raise EnvironmentFault(
                     f"Fault indicator {name} reported unhealthy state {observed!r}"
                 )
 
-    def _encode(self, signal_def: SignalDefinition, value: Any) -> CanMessage:
-        if signal_def.payload.type == "enum":
+    def bus_of(self, signal_name: str) -> str:
+        """Return the bus carrying ``signal_name``, opening its port if needed."""
+
+        return self._resolve(signal_name)[0].bus
+
+    def _get_signals_batch(self, signal_names: Iterable[str], timeout_s: float) -> Dict[str, Any]:
+        """Read the next value of every signal in ``signal_names`` in one pass.
+
+        Signals are grouped per CAN port and each port is drained once with a
+        filter covering all of its ids, so the total wait is bounded by the
+        slowest signal rather than the sum of all of them.  Frames are
+        read one at a time so a later frame for an id already read stays
+        queued for the next reader.  Values are returned in the order the
+        names were given.
+        """
+
+        names = list(dict.fromkeys(signal_names))
+        pending_by_port: Dict[BaseCanPort, Dict[int, List[Tuple[str, _Decoder]]]] = {}
+        for name in names:
+            signal_def, can_port, _, decode = self._resolve(name)
+            pending = pending_by_port.setdefault(can_port, {})
+            pending.setdefault(signal_def.can_id, []).append((name, decode))
+
+        clock = time.monotonic
+        deadline = clock() + timeout_s
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        observed: Dict[str, Any] = {}
+        with contextlib.ExitStack() as stack:
+            # Filters go on every port up front and stay until the whole pass
+            # is read, so unrelated traffic on the ports drained last does not
+            # queue up while the first ones are read.
+            for can_port, pending in pending_by_port.items():
+                stack.enter_context(can_port.filtered(frozenset(pending)))
+            for can_port, pending in pending_by_port.items():
+                while pending:
+                    remaining = deadline - clock()
+                    if remaining <= 0.0:
+                        missing = ", ".join(name for name in names if name not in observed)
+                        raise SutFault(f"Did not observe signals {missing} before timeout")
+                    try:
+                        message = can_port.receive_matching(pending.keys(), timeout_s=remaining)
+                    except CanTimeoutError:
+                        continue
+                    except HalError as exc:
+                        raise EnvironmentFault(
+                            f"HAL failure while reading {can_port.bus_name}: {exc}"
+                        ) from exc
+
+                    for name, decode in pending.pop(message.can_id, ()):
+                        observed[name] = decode(message)
+                        if debug:
+                            self._logger.debug("Read %s=%s", name, observed[name])
+
+        return {name: observed[name] for name in names}
+
+    def _resolve(self, signal_name: str) -> _Resolved:
+        """Return the definition, CAN port and codec for ``signal_name``, cached per name."""
+
+        try:
+            return self._resolved[signal_name]
+        except KeyError:
+            pass
+        signal_def = self._config.get(signal_name)
+        resolved = (signal_def, self._hal.get_can_port(signal_def.bus), *_build_codec(signal_def))
+        self._resolved[signal_name] = resolved
+        return resolved
+
+
+def _build_codec(signal_def: SignalDefinition) -> Tuple[_Encoder, _Decoder]:
+    """Return ``(encode, decode)`` functions specialised for ``signal_def``.
+
+    The payload type is inspected here, once per signal, so the functions
+    the broker calls per frame carry no type dispatch.
+    """
+
+    can_id = signal_def.can_id
+
+    if signal_def.payload.type == "enum":
+        encode_table = signal_def.payload.encode_table
+        decode_table = signal_def.payload.decode_table
+        # The label set is fixed, so every frame this signal can send is built
+        # here once; CanMessage is frozen and safe to hand out repeatedly.
+        messages = {
+            label: CanMessage(can_id=can_id, data=_BYTE_CACHE[payload_value])
+            for label, payload_value in encode_table.items()
+            if 0 <= payload_value <= 0xFF
+        }
+
+        def encode(value: Any) -> CanMessage:
+            label = str(value).upper()
             try:
-                payload_value = signal_def.payload.mapping[str(value).upper()]
+                return messages[label]
+            except KeyError:
+                pass
+            try:
+                payload_value = encode_table[label]
             except KeyError as exc:
                 raise ValueError(
                     f"Value {value!r} is not valid for signal {signal_def.name}"
                 ) from exc
-        else:
+            # Only labels whose value does not fit one byte get here.
+            return CanMessage(can_id=can_id, data=_payload_byte(signal_def, payload_value))
+
+        def decode(message: CanMessage) -> Any:
+            data = message.data
+            payload = data[0] if data else 0
+            return decode_table.get(payload, payload)
+
+    else:
+
+        # Filled on first use of each value rather than for all 256 up front.
+        pool: Dict[int, CanMessage] = {}
+
+        def encode(value: Any) -> CanMessage:
             payload_value = int(value)
+            try:
+                return pool[payload_value]
+            except KeyError:
+                pass
+            message = CanMessage(can_id=can_id, data=_payload_byte(signal_def, payload_value))
+            pool[payload_value] = message
+            return message
+
+        def decode(message: CanMessage) -> Any:
+            # Indexing yields the int directly; an empty frame decodes as 0
+            # as int.from_bytes(b"") did.
+            data = message.data
+            return data[0] if data else 0
+
+    return encode, decode
+
+
+def _expected_payload(encode: _Encoder, decode: _Decoder, expected_value: Any) -> Optional[int]:
+    """Return the raw payload byte that decodes to ``expected_value``, if any.
+
+    Lets waits compare the received byte directly instead of decoding every
+    frame.  ``None`` means no single byte round-trips to ``expected_value``
+    (it is not encodable, or is an alias or differently-cased label that
+    decodes to something else); the caller must then decode and compare.
+    """
+
+    try:
+        message = encode(expected_value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if decode(message) != expected_value:
+        return None
+    return message.data[0]
+
 
-        data = payload_value.to_bytes(1, byteorder="big")
-        return CanMessage(can_id=signal_def.can_id, data=data)
-
-    def _decode(self, signal_def: SignalDefinition, message: CanMessage) -> Any:
-        payload = int.from_bytes(message.data[:1], byteorder="big")
-        if signal_def.payload.type == "enum":
-            for key, value in signal_def.payload.mapping.items():
-                if value == payload:
-                    return key
-            return payload
-        return payload
+def _payload_byte(signal_def: SignalDefinition, payload_value: int) -> bytes:
+    if 0 <= payload_value <= 0xFF:
+        return _BYTE_CACHE[payload_value]
+    raise ValueError(
+        f"Value {payload_value!r} does not fit the one-byte payload of signal {signal_def.name}"
+    )
 
 
 __all__ = ["InteractionBroker"]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import collections
+import functools
 import logging
 import time
 from typing import Dict, Iterable, List, Optional
@@ -32,8 +33,7 @@ class DomainService:
     # ------------------------------------------------------------------
     def set_ignition_state(self, state: str) -> None:
         self._logger.info("Setting ignition state to %s", state)
-        self._broker.set_signal("VehicleIgnitionStatus", state)
-        self._broker.wait_for_signal("VehicleIgnitionStatus", state, timeout_s=5)
+        self._broker.set_and_confirm("VehicleIgnitionStatus", state, timeout_s=5)
 
     def set_signal(self, signal: str, value) -> None:
         self._broker.set_signal(signal, value)
@@ -46,8 +46,7 @@ class DomainService:
 
     def set_operating_mode(self, mode: str) -> None:
         self._logger.info("Setting operating mode to %s", mode)
-        self._broker.set_signal("VehicleOperatingMode", mode)
-        self._broker.wait_for_signal("VehicleOperatingMode", mode, timeout_s=5)
+        self._broker.set_and_confirm("VehicleOperatingMode", mode, timeout_s=5)
 
     def ensure_precondition(self, name: str) -> None:
         self._logger.info("Ensuring precondition %s", name)
@@ -55,13 +54,13 @@ class DomainService:
 
     def apply_epb(self, state: str) -> None:
         self._logger.info("Commanding EPB state %s", state)
-        self._broker.set_signal("EPBCommand", state)
-        self._broker.wait_for_signal("EPBStatus", state, timeout_s=5)
+        self._broker.set_and_confirm("EPBCommand", state, timeout_s=5, confirm_signal="EPBStatus")
 
     def set_gear(self, gear: str) -> None:
         self._logger.info("Selecting gear %s", gear)
-        self._broker.set_signal("GearCommand", gear)
-        self._broker.wait_for_signal("GearPosition", gear, timeout_s=5)
+        self._broker.set_and_confirm(
+            "GearCommand", gear, timeout_s=5, confirm_signal="GearPosition"
+        )
 
     def set_vehicle_speed(self, speed: float) -> None:
         speed_value = float(speed)
@@ -160,7 +159,7 @@ class DomainService:
         self._broker.set_signal("HMINavigationState", path.upper())
 
     def expect_telltale(self, name: str, state: str) -> None:
-        signal = f"ClusterTelltale{name.replace(' ', '')}"
+        signal = _telltale_signal(name)
         self._broker.assert_signal_equal(signal, state.upper(), timeout_s=5)
 
     def hmi_open_app(self, app: str) -> None:
@@ -172,29 +171,24 @@ class DomainService:
         self._broker.set_signal("HMISelection", option_path.upper())
 
     def wait_someip_field(self, path: str, value: str, timeout_s: float = 5.0) -> None:
-        signal = self._normalize_someip_path(path)
+        signal = _someip_signal(path)
         self._broker.wait_for_signal(signal, value.upper(), timeout_s=timeout_s)
 
-    def _normalize_someip_path(self, path: str) -> str:
-        normalized = path.replace(".", "_").replace("/", "_").upper()
-        return f"SOMEIP::{normalized}"
-
     # ------------------------------------------------------------------
     # Brain / wired I/O
     # ------------------------------------------------------------------
     def set_securement_state(self, state: str) -> None:
-        self._broker.set_signal("SecurementState", state.upper())
-        self._broker.wait_for_signal("SecurementState", state.upper(), timeout_s=5)
+        self._broker.set_and_confirm("SecurementState", state.upper(), timeout_s=5)
 
     def verify_securement_state(self, state: str) -> None:
         self._broker.assert_signal_equal("SecurementState", state.upper(), timeout_s=5)
 
     def wired_set(self, name: str, value) -> None:
-        signal = f"WIRED::{name.upper()}"
+        signal = _wired_signal(name)
         self._broker.set_signal(signal, value)
 
     def verify_wired_output(self, name: str, value) -> None:
-        signal = f"WIRED::{name.upper()}"
+        signal = _wired_signal(name)
         self._broker.assert_signal_equal(signal, value, timeout_s=5)
 
     def verify_bus_signal(self, name: str, value) -> None:
@@ -204,32 +198,29 @@ class DomainService:
     # Zonal domains
     # ------------------------------------------------------------------
     def set_front_door(self, door: str, state: str) -> None:
-        signal = f"Door{door.upper()}State"
-        self._broker.set_signal(signal, state.upper())
-        self._broker.wait_for_signal(signal, state.upper(), timeout_s=5)
+        self._broker.set_and_confirm(_door_signal(door), state.upper(), timeout_s=5)
 
     def verify_door_state(self, door: str, state: str) -> None:
-        signal = f"Door{door.upper()}State"
+        signal = _door_signal(door)
         self._broker.assert_signal_equal(signal, state.upper(), timeout_s=5)
 
     def set_low_beam(self, state: str) -> None:
-        self._broker.set_signal("LowBeamCommand", state.upper())
-        self._broker.wait_for_signal("LowBeamState", state.upper(), timeout_s=5)
+        self._broker.set_and_confirm(
+            "LowBeamCommand", state.upper(), timeout_s=5, confirm_signal="LowBeamState"
+        )
 
     def verify_low_beam(self, state: str) -> None:
         self._broker.assert_signal_equal("LowBeamState", state.upper(), timeout_s=5)
 
     def set_seatbelt(self, seat: str, state: str) -> None:
-        signal = f"Seatbelt{seat.upper()}State"
-        self._broker.set_signal(signal, state.upper())
-        self._broker.wait_for_signal(signal, state.upper(), timeout_s=5)
+        self._broker.set_and_confirm(_seatbelt_signal(seat), state.upper(), timeout_s=5)
 
     def command_window(self, door: str, command: str) -> None:
-        signal = f"Window{door.upper()}Command"
+        signal = _window_signal(door, "Command")
         self._broker.set_signal(signal, command.upper())
 
     def verify_window_position(self, door: str, state: str) -> None:
-        signal = f"Window{door.upper()}Position"
+        signal = _window_signal(door, "Position")
         self._broker.assert_signal_equal(signal, state.upper(), timeout_s=5)
 
     def set_hvac_temperature(self, temperature: float) -> None:
@@ -249,16 +240,15 @@ class DomainService:
     # ADAS
     # ------------------------------------------------------------------
     def adas_enable(self, feature: str) -> None:
-        signal = f"ADAS{feature.upper()}State"
+        signal = _adas_signal(feature)
         self._broker.set_signal(signal, "ENABLED")
 
     def adas_disable(self, feature: str) -> None:
-        signal = f"ADAS{feature.upper()}State"
+        signal = _adas_signal(feature)
         self._broker.set_signal(signal, "DISABLED")
 
     def adas_set_speed(self, speed: float) -> None:
-        self._broker.set_signal("ADASpeedSetpoint", int(speed))
-        self._broker.wait_for_signal("ADASpeedSetpoint", int(speed), timeout_s=5)
+        self._broker.set_and_confirm("ADASpeedSetpoint", int(speed), timeout_s=5)
 
     def adas_inject_obstacle(self, distance: float) -> None:
         self._broker.set_signal("ADASObstacleDistance", int(distance))
@@ -295,14 +285,15 @@ class DomainService:
     # Lighting / environment
     # ------------------------------------------------------------------
     def set_high_beam(self, state: str) -> None:
-        self._broker.set_signal("HighBeamCommand", state.upper())
-        self._broker.wait_for_signal("HighBeamState", state.upper(), timeout_s=5)
+        self._broker.set_and_confirm(
+            "HighBeamCommand", state.upper(), timeout_s=5, confirm_signal="HighBeamState"
+        )
 
     def flash_to_pass(self) -> None:
         self._broker.set_signal("HighBeamCommand", "FLASH")
 
     def verify_light_availability(self, name: str, state: str) -> None:
-        signal = f"LightAvailability{name.replace(' ', '')}"
+        signal = _light_availability_signal(name)
         self._broker.assert_signal_equal(signal, state.upper(), timeout_s=5)
 
     # ------------------------------------------------------------------
@@ -352,4 +343,53 @@ class DomainService:
         self._broker.set_signal("EcuHeartbeat", ecu.upper())
 
 
+# ----------------------------------------------------------------------
+# Signal naming
+# ----------------------------------------------------------------------
+# Each family of parametrised signals is named in exactly one place, so the
+# set/verify pairs above cannot drift apart.  Suites reuse a small set of
+# names thousands of times, so each helper memoises its result.
+
+
+@functools.lru_cache(maxsize=1024)
+def _someip_signal(path: str) -> str:
+    normalized = path.replace(".", "_").replace("/", "_").upper()
+    return f"SOMEIP::{normalized}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _telltale_signal(name: str) -> str:
+    return f"ClusterTelltale{name.replace(' ', '')}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _light_availability_signal(name: str) -> str:
+    return f"LightAvailability{name.replace(' ', '')}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _wired_signal(name: str) -> str:
+    return f"WIRED::{name.upper()}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _door_signal(door: str) -> str:
+    return f"Door{door.upper()}State"
+
+
+@functools.lru_cache(maxsize=1024)
+def _seatbelt_signal(seat: str) -> str:
+    return f"Seatbelt{seat.upper()}State"
+
+
+@functools.lru_cache(maxsize=1024)
+def _window_signal(door: str, field: str) -> str:
+    return f"Window{door.upper()}{field}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _adas_signal(feature: str) -> str:
+    return f"ADAS{feature.upper()}State"
+
+
 __all__ = ["DomainService"]
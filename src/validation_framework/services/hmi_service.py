@@ -1,16 +1,39 @@
 """Domain oriented service for Human Machine Interface operations."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from .domain_service import DomainService
 
+# HmiService name -> DomainService method it is a straight alias of.
+_FORWARD = {
+    "set_signal": "set_signal",
+    "wait_for_signal": "wait_for_signal",
+    "press": "hmi_press",
+    "navigate": "hmi_navigate",
+    "expect_telltale": "expect_telltale",
+    "open_app": "hmi_open_app",
+    "select": "hmi_select",
+}
+
 
 class HmiService:
     """Encapsulates HMI logic using the InteractionBroker."""
 
+    # Bound to the DomainService methods named in _FORWARD, so calling them
+    # costs no extra wrapper frame.
+    set_signal: Callable[[str, Any], None]
+    wait_for_signal: Callable[[str, Any, float], None]
+    press: Callable[[str], None]
+    navigate: Callable[[str], None]
+    expect_telltale: Callable[[str, str], None]
+    open_app: Callable[[str], None]
+    select: Callable[[str], None]
+
     def __init__(self, domain: DomainService):
         self._domain = domain
+        for name, target in _FORWARD.items():
+            setattr(self, name, getattr(domain, target))
 
     def activate_wipers(self, mode: str) -> None:
         """Activate the wipers in a particular mode."""
@@ -18,26 +41,5 @@ class HmiService:
         self._domain.set_wiper_mode(mode)
         self._domain.verify_wipers_state("ACTIVE")
 
-    def set_signal(self, signal: str, value: Any) -> None:
-        self._domain.set_signal(signal, value)
-
-    def wait_for_signal(self, signal: str, value: Any, timeout_s: float) -> None:
-        self._domain.wait_for_signal(signal, value, timeout_s=timeout_s)
-
-    def press(self, control: str) -> None:
-        self._domain.hmi_press(control)
-
-    def navigate(self, path: str) -> None:
-        self._domain.hmi_navigate(path)
-
-    def expect_telltale(self, name: str, state: str) -> None:
-        self._domain.expect_telltale(name, state)
-
-    def open_app(self, app: str) -> None:
-        self._domain.hmi_open_app(app)
-
-    def select(self, option_path: str) -> None:
-        self._domain.hmi_select(option_path)
-
 
 __all__ = ["HmiService"]
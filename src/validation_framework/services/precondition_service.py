@@ -1,13 +1,17 @@
 """Service responsible for applying declarative preconditions."""
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import Callable, Dict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..config_loader.models import PreconditionCatalog, PreconditionDefinition
+from ..config_loader.models import PreconditionCatalog, PreconditionDefinition, PreconditionStep
 from ..middleware.broker import InteractionBroker
 from ..middleware.exceptions import EnvironmentFault
 
+_MAX_GROUP_WORKERS = 8
+
 
 class PreconditionService:
     """Evaluate preconditions using middleware interactions."""
@@ -33,8 +37,7 @@ class PreconditionService:
         definition = self._catalog.get(name)
         self._logger.info("Applying precondition %s", name)
         try:
-            for step in definition.steps:
-                self._dispatch(step.action, step.target, step.value)
+            self._run_steps(definition.steps)
         except Exception as exc:
             self._logger.error("Precondition %s failed: %s", name, exc)
             self._rollback(definition)
@@ -43,10 +46,98 @@ class PreconditionService:
     def register_action(self, name: str, handler: Callable[[str, object], None]) -> None:
         self._actions[name] = handler
 
+    def _run_steps(self, steps: Iterable[PreconditionStep]) -> None:
+        """Run ``steps``, overlapping contiguous steps that share a ``group``.
+
+        Ungrouped steps, and groups of a single step, keep strict ordering.
+        """
+
+        serial: List[PreconditionStep] = []
+        for group, run in itertools.groupby(steps, key=lambda step: step.group):
+            grouped = list(run)
+            if group is None or len(grouped) == 1:
+                serial.extend(grouped)
+                continue
+            self._run_serial(serial)
+            serial = []
+            self._run_concurrent(grouped)
+        self._run_serial(serial)
+
+    def _run_concurrent(self, steps: List[PreconditionStep]) -> None:
+        """Run one group, with one worker per CAN bus its targets live on.
+
+        Steps on the same bus stay in order on one worker: two concurrent
+        receivers on a port would consume each other's frames.  Steps whose
+        target is not a signal may touch any bus, so they run serially once
+        every lane has finished.  Once a step fails, lanes that have not
+        started are cancelled and running ones are awaited, so rollback never
+        races the group.
+        """
+
+        lanes: Dict[str, List[PreconditionStep]] = {}
+        unbound: List[PreconditionStep] = []
+        for step in steps:
+            lane = self._lane_of(step)
+            if lane is None:
+                unbound.append(step)
+            else:
+                lanes.setdefault(lane, []).append(step)
+        if len(lanes) <= 1:
+            self._run_serial(steps)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(lanes), _MAX_GROUP_WORKERS), thread_name_prefix="precondition"
+        ) as executor:
+            futures = [executor.submit(self._run_serial, lane) for lane in lanes.values()]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        for future in futures:
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                raise error
+        self._run_serial(unbound)
+
+    def _lane_of(self, step: PreconditionStep) -> Optional[str]:
+        try:
+            return self._broker.bus_of(step.target)
+        except KeyError:
+            # Custom actions may target something other than a signal.
+            return None
+
+    def _run_serial(self, steps: Iterable[PreconditionStep]) -> None:
+        """Dispatch ``steps`` in order, sending runs of ``set_signal`` as one batch.
+
+        Batching only applies while ``set_signal`` is still handled by this
+        service; a handler installed via :meth:`register_action` sees every
+        step individually.
+        """
+
+        actions = self._actions
+        set_signals = self._broker.set_signals
+        batch_set = actions.get("set_signal") == self._set_signal
+        pending: List[Tuple[str, object]] = []
+        for step in steps:
+            action = step.action
+            if batch_set and action == "set_signal":
+                pending.append((step.target, step.value))
+                continue
+            if pending:
+                set_signals(pending)
+                pending = []
+            handler = actions.get(action)
+            if handler is None:
+                raise KeyError(f"Unsupported precondition action: {action}")
+            handler(step.target, step.value)
+        if pending:
+            set_signals(pending)
+
     def _dispatch(self, action: str, target: str, value) -> None:
-        if action not in self._actions:
+        handler = self._actions.get(action)
+        if handler is None:
             raise KeyError(f"Unsupported precondition action: {action}")
-        self._actions[action](target, value)
+        handler(target, value)
 
     def _set_signal(self, target: str, value) -> None:
         self._broker.set_signal(target, value)
@@ -75,11 +166,38 @@ class PreconditionService:
         if not definition.rollback:
             return
         self._logger.info("Rolling back precondition %s", definition.name)
-        for step in definition.rollback:
-            try:
-                self._dispatch(step.action, step.target, step.value)
-            except Exception as exc:  # pragma: no cover - failure path
-                self._logger.error("Rollback step %s failed: %s", step.action, exc)
+        for step, exc in self._attempt_all(definition.rollback):
+            self._logger.error("Rollback step %s failed: %s", step.action, exc)
+
+    def _attempt_all(
+        self, steps: Iterable[PreconditionStep]
+    ) -> List[Tuple[PreconditionStep, Exception]]:
+        """Run every step regardless of earlier failures; return the failures in order.
+
+        Runs of ``set_signal`` steps go out as one :meth:`InteractionBroker.set_signals`
+        burst.  If the burst fails, the run is replayed step by step so every
+        step is still attempted and each failure is attributed to its step;
+        rollback writes are idempotent, so re-sending frames is harmless.
+        """
+
+        batch_set = self._actions.get("set_signal") == self._set_signal
+        failures: List[Tuple[PreconditionStep, Exception]] = []
+        for is_set, run in itertools.groupby(
+            steps, key=lambda step: batch_set and step.action == "set_signal"
+        ):
+            run_steps = list(run)
+            if is_set and len(run_steps) > 1:
+                try:
+                    self._broker.set_signals([(step.target, step.value) for step in run_steps])
+                    continue
+                except Exception:  # pragma: no cover - failure path
+                    pass
+            for step in run_steps:
+                try:
+                    self._dispatch(step.action, step.target, step.value)
+                except Exception as exc:  # pragma: no cover - failure path
+                    failures.append((step, exc))
+        return failures
 
 
 __all__ = ["PreconditionService"]